@@ -1,4 +1,5 @@
 from pathlib import Path
+import os
 import json
 import logging
 from pydantic import BaseModel, Field, ValidationError
@@ -24,6 +25,7 @@ class VoiceClickConfig(BaseModel):
     whisper_device: str = Field("cpu", description="Device for Whisper (cuda or cpu).")
     whisper_compute_type: str = Field("int8", description="Compute type (float16, int8, float32).")
     transcription_language: str = Field("en", description="Language for transcription (e.g., en, tr, de).")
+    enable_streaming_transcription: bool = Field(False, description="Transcribe 30s windows while recording so long dictations finish faster.")
     
     # Auto-start options
     auto_start_on_focus: bool = Field(False, description="Start recording automatically when a text field receives focus.")
@@ -70,7 +72,10 @@ class ConfigManager:
         try:
             # Use model_dump to get a dictionary representation of the config
             data = self.config.model_dump(mode='json')
-            self.CONFIG_FILE.write_text(json.dumps(data, indent=2))
+            # Write a temp file and atomically swap it in so a crash can't truncate the config
+            tmp_file = self.CONFIG_FILE.with_suffix(self.CONFIG_FILE.suffix + '.tmp')
+            tmp_file.write_text(json.dumps(data, indent=2))
+            os.replace(tmp_file, self.CONFIG_FILE)
             logger.info(f"Configuration saved to {self.CONFIG_FILE}")
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -79,8 +84,8 @@ class ConfigManager:
         """Retrieves a configuration value by key."""
         return getattr(self.config, key)
 
-    def set(self, key: str, value):
-        """Sets a configuration value by key and saves it."""
+    def set(self, key: str, value, save: bool = True):
+        """Sets a configuration value by key and saves it (pass save=False to batch several sets)."""
         if hasattr(self.config, key):
             try:
                 # Use model_validate to ensure the new value conforms to the schema type
@@ -93,7 +98,8 @@ class ConfigManager:
                 
                 # If validation passes, update the internal config object
                 setattr(self.config, key, getattr(validated_config, key))
-                self.save_config()
+                if save:
+                    self.save_config()
                 return True
             except ValidationError as e:
                 logger.error(f"Validation error for setting '{key}' to '{value}': {e}")
@@ -8,24 +8,30 @@ import numpy as np
 import sounddevice as sd
 import threading
 import time
-from queue import Queue
+from queue import Queue, Empty, Full
 from collections import deque
 from pynput import mouse
+import keyboard
 import win32gui
 import win32con
+import win32clipboard  # Direct clipboard access (no pyperclip round-trips)
+import pywintypes
 import ctypes
-from ctypes import Structure, c_ulong, wintypes
+from ctypes import Structure, Union, c_ulong, c_size_t, wintypes
 import tkinter as tk
 from tkinter import ttk
-import keyboard
-from faster_whisper import WhisperModel
+import os
 import sys
+import atexit
 import winsound
 import logging
 from datetime import datetime
 import json
 from pathlib import Path
-import pyperclip  # For clipboard functionality
+try:
+    import orjson  # Optional: faster history serialization
+except ImportError:
+    orjson = None
 import traceback  # For detailed error logging
 from .config_manager import config_manager
 
@@ -61,13 +67,13 @@ def log_error(error_msg, exception=None):
         logger.error(f"Exception details: {str(exception)}")
         logger.debug(traceback.format_exc())
 
-def log_info(msg):
-    """Centralized info logging"""
-    logger.info(msg)
+def log_info(msg, *args):
+    """Centralized info logging (args are %-formatted only if the record is emitted)"""
+    logger.info(msg, *args)
 
-def log_debug(msg):
-    """Centralized debug logging"""
-    logger.debug(msg)
+def log_debug(msg, *args):
+    """Centralized debug logging (args are %-formatted only if the record is emitted)"""
+    logger.debug(msg, *args)
 
 # GUITHREADINFO structure
 class GUITHREADINFO(Structure):
@@ -83,35 +89,173 @@ class GUITHREADINFO(Structure):
         ("rcCaret", wintypes.RECT),
     ]
 
+# CURSORINFO structure
+class CURSORINFO(Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("hCursor", wintypes.HANDLE),  # Use HANDLE instead of HCURSOR
+        ("ptScreenPos", wintypes.POINT),
+    ]
+
+# SendInput structures
+class KEYBDINPUT(Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", c_size_t),
+    ]
+
+class MOUSEINPUT(Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", c_size_t),
+    ]
+
+class HARDWAREINPUT(Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+class _INPUTUNION(Union):
+    # All members are declared so sizeof(INPUT) matches the Win32 definition
+    _fields_ = [
+        ("ki", KEYBDINPUT),
+        ("mi", MOUSEINPUT),
+        ("hi", HARDWAREINPUT),
+    ]
+
+class INPUT(Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [
+        ("type", wintypes.DWORD),
+        ("u", _INPUTUNION),
+    ]
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+VK_CONTROL = 0x11
+VK_V = 0x56
+VK_RETURN = 0x0D
+VK_TAB = 0x09
+TYPE_TEXT_VIRTUAL_KEYS = {ord('\n'): VK_RETURN, ord('\t'): VK_TAB}
+
+# WinEvent hook for foreground-window changes
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+WM_QUIT = 0x0012
+
+# Polling fallback intervals (adaptive: backs off while focus is idle)
+FOCUS_POLL_MIN_S = 0.15
+FOCUS_POLL_MAX_S = 1.2
+FOCUS_POLL_IDLE_MAX = 9  # Idle polls counted before the interval stops growing
+
 # Configuration
-SAMPLE_RATE = 16000 # Fixed audio setting
+TEXT_FIELD_CACHE_TTL = 0.05  # Seconds a text field check is reused for the same foreground window
+SCREEN_SIZE_CACHE_TTL = 5.0  # Seconds the screen size is reused
+PROGRESS_UPDATE_INTERVAL = 0.1  # Minimum seconds between partial transcription repaints
+CLIPBOARD_OPEN_ATTEMPTS = 12  # OpenClipboard retries (1 ms doubling to 50 ms)
+SAMPLE_RATE = 16000 # Fixed audio setting (Whisper input rate)
+INT16_SCALE = 1.0 / 32768.0  # int16 PCM -> float32 [-1, 1)
+
+# Streaming transcription (fixed)
+STREAMING_WINDOW_S = 30  # Whisper's native context length
+STREAMING_CUT_SEARCH_S = 5  # Each window ends at the quietest point of its last 5s
+STREAMING_POLL_S = 5  # How often the streaming worker checks for a full window
 
-# History file location (fixed)
-HISTORY_FILE = Path.home() / ".voice_click_history.json"
+# History file location (fixed) - one JSON entry per line, appended on save
+HISTORY_FILE = Path.home() / ".voice_click_history.jsonl"
+LEGACY_HISTORY_FILE = Path.home() / ".voice_click_history.json"
+HISTORY_FLUSH_DELAY = 0.5  # Seconds to coalesce history writes
 
 # NOTE: All configuration constants are now accessed via config_manager.get('key')
 
 # Globals
 is_recording = False
-audio_queue = Queue()  # Thread-safe audio buffer
+audio_buffer = np.empty(0, dtype=np.int16)  # Preallocated int16 recording buffer (written by audio callback)
+audio_buffer_pos = 0  # Number of valid samples in audio_buffer
+audio_sum_squares = 0.0  # Running sum of squared samples of the recording (for its average volume)
+capture_sample_rate = SAMPLE_RATE  # Native rate of the input device (set in main)
+resample_poly = None  # scipy.signal.resample_poly, imported in main only for non-16 kHz devices
+streaming_session = None  # StreamingTranscription of the current recording (None when streaming is off)
 model = None
 status_widget = None
 settings_widget = None # New global for settings widget
 recording_start_time = 0
 current_volume = 0.0
 transcription_history = deque(maxlen=config_manager.get('max_history'))
+history_file_lines = 0  # Entries in HISTORY_FILE (may exceed the deque until compacted)
+history_pending = []  # Entries not yet written to HISTORY_FILE
+history_flush_timer = None
+history_lock = threading.Lock()
 last_silence_time = 0
 auto_stopped = False
 focus_monitor_thread = None
 focus_monitor_stop = False
+focus_monitor_thread_id = None  # Native thread id running the focus event loop
+focus_event_queue = Queue(maxsize=16)  # Focus changes waiting for the dispatcher
+focus_monitor_wakeup = threading.Event()  # Set on stop to interrupt the polling fallback
 original_focused_hwnd = None  # Track focused control when recording starts
 mouse_move_history = deque(maxlen=10) # Store (x, y, timestamp) for shake detection
 beep_thread = None
 stop_beeping = False
 recording_lock = threading.Lock()  # Thread safety
+text_field_cache = None  # (timestamp, foreground hwnd, result) of the last text field check
+paste_inputs = None  # Reused Ctrl+V SendInput records
+type_inputs = (INPUT * 0)()  # Reused SendInput buffer for type_text (grown on demand)
+input_action_queue = Queue()  # Mouse actions handed off from the pynput listener thread
 
 # --- Settings Widget ---
 
+# Settings widget layout: tab name -> (config key, variable type, label, control, options)
+SETTINGS_TABS = {
+    # Tab 1: General & Mouse
+    'General & Mouse': [
+        ('mouse_shake_threshold_px', tk.IntVar, 'Mouse Shake Threshold (px):', 'Entry', None),
+        ('mouse_shake_time_ms', tk.IntVar, 'Mouse Shake Time (ms):', 'Entry', None),
+        ('enable_manual_stop', tk.BooleanVar, 'Enable Manual Stop (Middle-Click):', 'Checkbutton', None),
+        ('require_text_field', tk.BooleanVar, 'Require Text Field to Start:', 'Checkbutton', None),
+        ('max_history', tk.IntVar, 'Max History Entries:', 'Entry', None),
+    ],
+    # Tab 2: Auto-Start
+    'Auto-Start': [
+        ('auto_start_on_focus', tk.BooleanVar, 'Auto-Start on Text Field Focus:', 'Checkbutton', None),
+        ('auto_start_on_left_click', tk.BooleanVar, 'Auto-Start on Left-Click:', 'Checkbutton', None),
+        ('auto_start_delay', tk.DoubleVar, 'Auto-Start Delay (s):', 'Entry', None),
+        ('ignore_password_fields', tk.BooleanVar, 'Ignore Password Fields:', 'Checkbutton', None),
+        ('ignore_fullscreen_games', tk.BooleanVar, 'Ignore Fullscreen Games:', 'Checkbutton', None),
+    ],
+    # Tab 3: Audio & Auto-Stop
+    'Audio & Auto-Stop': [
+        ('volume_threshold', tk.DoubleVar, 'Volume Threshold (RMS):', 'Entry', None),
+        ('enable_silence_auto_stop', tk.BooleanVar, 'Enable Silence Auto-Stop:', 'Checkbutton', None),
+        ('silence_duration', tk.DoubleVar, 'Silence Duration (s):', 'Entry', None),
+        ('max_recording_time', tk.IntVar, 'Max Recording Time (s):', 'Entry', None),
+        ('enable_audio_feedback', tk.BooleanVar, 'Enable Audio Feedback (Beeps):', 'Checkbutton', None), # New setting
+    ],
+    # Tab 4: Transcription Model
+    'Transcription Model': [
+        ('whisper_model', tk.StringVar, 'Whisper Model:', 'Combobox', ['tiny', 'base', 'small', 'medium', 'large-v2', 'large-v3']),
+        ('whisper_device', tk.StringVar, 'Whisper Device:', 'Combobox', ['cpu', 'cuda']),
+        ('whisper_compute_type', tk.StringVar, 'Compute Type:', 'Combobox', ['float16', 'int8', 'float32']),
+        ('transcription_language', tk.StringVar, 'Transcription Language:', 'Combobox', ['en', 'tr', 'de']),
+        ('enable_streaming_transcription', tk.BooleanVar, 'Streaming Transcription:', 'Checkbutton', None),
+    ]
+}
+
 def toggle_settings_widget():
     """Toggles the visibility of the settings widget."""
     global settings_widget
@@ -142,6 +286,8 @@ class SettingsWidget:
         # Dragging setup
         self._offsetx = 0
         self._offsety = 0
+        self._pending_move = None
+        self._move_job = None
         self.root.bind('<Button-1>', self.start_move)
         self.root.bind('<ButtonRelease-1>', self.stop_move)
         self.root.bind('<B1-Motion>', self.do_move)
@@ -168,55 +314,35 @@ class SettingsWidget:
         self.notebook = ttk.Notebook(self.frame)
         self.notebook.pack(pady=10, padx=5, fill=tk.BOTH, expand=True)
         
-        # 3. Define and link 18 tk.Variable instances
+        # 3. Link tk.Variable instances (created per tab, see SETTINGS_TABS)
         self.vars = {}
-        self.settings_map = {
-            # Tab 1: General & Mouse
-            'General & Mouse': [
-                ('mouse_shake_threshold_px', tk.IntVar, 'Mouse Shake Threshold (px):', 'Entry', None),
-                ('mouse_shake_time_ms', tk.IntVar, 'Mouse Shake Time (ms):', 'Entry', None),
-                ('enable_manual_stop', tk.BooleanVar, 'Enable Manual Stop (Middle-Click):', 'Checkbutton', None),
-                ('require_text_field', tk.BooleanVar, 'Require Text Field to Start:', 'Checkbutton', None),
-                ('max_history', tk.IntVar, 'Max History Entries:', 'Entry', None),
-            ],
-            # Tab 2: Auto-Start
-            'Auto-Start': [
-                ('auto_start_on_focus', tk.BooleanVar, 'Auto-Start on Text Field Focus:', 'Checkbutton', None),
-                ('auto_start_on_left_click', tk.BooleanVar, 'Auto-Start on Left-Click:', 'Checkbutton', None),
-                ('auto_start_delay', tk.DoubleVar, 'Auto-Start Delay (s):', 'Entry', None),
-                ('ignore_password_fields', tk.BooleanVar, 'Ignore Password Fields:', 'Checkbutton', None),
-                ('ignore_fullscreen_games', tk.BooleanVar, 'Ignore Fullscreen Games:', 'Checkbutton', None),
-            ],
-            # Tab 3: Audio & Auto-Stop
-            'Audio & Auto-Stop': [
-                ('volume_threshold', tk.DoubleVar, 'Volume Threshold (RMS):', 'Entry', None),
-                ('enable_silence_auto_stop', tk.BooleanVar, 'Enable Silence Auto-Stop:', 'Checkbutton', None),
-                ('silence_duration', tk.DoubleVar, 'Silence Duration (s):', 'Entry', None),
-                ('max_recording_time', tk.IntVar, 'Max Recording Time (s):', 'Entry', None),
-                ('enable_audio_feedback', tk.BooleanVar, 'Enable Audio Feedback (Beeps):', 'Checkbutton', None), # New setting
-            ],
-            # Tab 4: Transcription Model
-            'Transcription Model': [
-                ('whisper_model', tk.StringVar, 'Whisper Model:', 'Combobox', ['tiny', 'base', 'small', 'medium', 'large-v2', 'large-v3']),
-                ('whisper_device', tk.StringVar, 'Whisper Device:', 'Combobox', ['cpu', 'cuda']),
-                ('whisper_compute_type', tk.StringVar, 'Compute Type:', 'Combobox', ['float16', 'int8', 'float32']),
-                ('transcription_language', tk.StringVar, 'Transcription Language:', 'Combobox', ['en', 'tr', 'de']),
-            ]
-        }
         
-        # 4. Implement UI controls
-        for tab_name, settings in self.settings_map.items():
+        # 4. Implement UI controls (tab contents are built on first selection)
+        self.unbuilt_tabs = {}
+        for tab_name in SETTINGS_TABS:
             tab = ttk.Frame(self.notebook, padding="10")
             self.notebook.add(tab, text=tab_name)
-            
-            for key, var_type, label_text, control_type, options in settings:
-                self.vars[key] = var_type(value=config_manager.get(key))
-                description = self.descriptions.get(key, "No description available.")
-                self._create_control(tab, key, label_text, control_type, options, description)
+            self.unbuilt_tabs[str(tab)] = (tab, tab_name)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._build_tab(self.notebook.select())
 
         # Save/Close Button
         tk.Button(self.frame, text="Save & Close", command=self.save_and_hide, bg='#2ecc71', fg='black', relief=tk.FLAT, font=('Segoe UI', 10, 'bold')).pack(pady=10)
 
+    def _on_tab_changed(self, event):
+        self._build_tab(self.notebook.select())
+
+    def _build_tab(self, tab_id):
+        """Create the controls of a tab the first time it is shown"""
+        entry = self.unbuilt_tabs.pop(str(tab_id), None)
+        if entry is None:
+            return
+        tab, tab_name = entry
+        for key, var_type, label_text, control_type, options in SETTINGS_TABS[tab_name]:
+            self.vars[key] = var_type(value=config_manager.get(key))
+            description = self.descriptions.get(key, "No description available.")
+            self._create_control(tab, key, label_text, control_type, options, description)
+
     def _create_control(self, parent, key, label_text, control_type, options=None, description=""):
         """Helper function to create a setting control."""
         
@@ -247,16 +373,23 @@ class SettingsWidget:
             ttk.Label(main_frame, text=description, wraplength=550, justify=tk.LEFT, font=('Segoe UI', 8, 'italic'), foreground='#aaaaaa').pack(fill=tk.X, padx=10, pady=(0, 5))
 
     def start_move(self, event):
-        self._offsetx = event.x
-        self._offsety = event.y
+        # Offset of the pointer from the window origin (event.x is relative to the child widget)
+        self._offsetx = event.x_root - self.root.winfo_x()
+        self._offsety = event.y_root - self.root.winfo_y()
 
     def stop_move(self, event):
         self._offsetx = 0
         self._offsety = 0
 
     def do_move(self, event):
-        x = self.root.winfo_x() + event.x - self._offsetx
-        y = self.root.winfo_y() + event.y - self._offsety
+        # Coalesce motion events: move the window at most once per frame
+        self._pending_move = (event.x_root - self._offsetx, event.y_root - self._offsety)
+        if self._move_job is None:
+            self._move_job = self.root.after(16, self._apply_move)
+
+    def _apply_move(self):
+        self._move_job = None
+        x, y = self._pending_move
         self.root.geometry(f"+{x}+{y}")
 
     def save_and_hide(self):
@@ -276,7 +409,11 @@ class SettingsWidget:
                 
                 # Tkinter DoubleVar/IntVar returns float/int, which is fine.
                 
-                if config_manager.set(key, value):
+                # Unchanged values need no validation or write
+                if value == config_manager.get(key):
+                    continue
+                
+                if config_manager.set(key, value, save=False):
                     log_debug(f"Successfully set config key '{key}' to '{value}'")
                     success_count += 1
                 else:
@@ -287,6 +424,9 @@ class SettingsWidget:
                 error_count += 1
                 log_error(f"Error processing setting '{key}' with value '{value}': {e}")
         
+        # Write the config file once for the whole batch (not at all if nothing changed)
+        if success_count:
+            config_manager.save_config()
         log_info(f"Settings save complete: {success_count} successful, {error_count} failed.")
         self.hide()
 
@@ -305,6 +445,114 @@ class SettingsWidget:
         self.root.withdraw()
         self.is_visible = False
 
+# --- Window Detection ---
+
+# Common game engine class names
+GAME_WINDOW_CLASSES = (
+    'unitywindowclass',  # Unity games
+    'unrealwindow',      # Unreal Engine
+    'sdl_app',           # SDL games
+    'd3d',               # DirectX
+    'opengl',            # OpenGL
+    'gameoverlayui',     # Steam overlay
+)
+
+# Common game keywords in titles
+GAME_TITLE_KEYWORDS = (
+    'game', 'steam', 'epic', 'origin', 'uplay', 'gog',
+    'league of legends', 'valorant', 'fortnite', 'minecraft',
+    'counter-strike', 'dota', 'overwatch', 'apex', 'warzone',
+    'rocket league', 'genshin', 'final fantasy', 'world of warcraft',
+    'destiny', 'battlefield', 'call of duty', 'assassin', 'cyberpunk',
+    'the witcher', 'elden ring', 'dark souls', 'starcraft', 'diablo'
+)
+
+# Fullscreen desktop apps that are not games
+DESKTOP_APP_KEYWORDS = (
+    'explorer', 'taskbar', 'chrome', 'firefox', 'edge',
+    'code', 'visual studio', 'notepad', 'word', 'excel'
+)
+
+# I-beam cursor handles (varies by system/theme)
+# Common values: 65541 (standard), 65567, 65559
+# Arrow cursor: 65543, Hand: 65567
+IBEAM_CURSOR_HANDLES = frozenset((65541, 65567, 65559, 65553))
+
+# Comprehensive list of text field class names (substring match, lowercase)
+TEXT_CONTROL_CLASSES = (
+    'edit',           # Standard Windows edit control
+    'richedit',       # Rich edit controls
+    'richedit20',     # Rich edit 2.0+
+    'scintilla',      # Scintilla editor (Notepad++, VS Code)
+    'chrome_renderwidgethost', # Chrome/Edge text fields
+    'chrome_widgetwin',        # Chrome windows
+    'mozilla',        # Firefox
+    'gecko',          # Firefox engine
+    'textfield',      # Generic text field
+    'textarea',       # Textarea elements
+    'input',          # Input elements
+    'edit control',   # Edit controls
+    'text',           # General text controls
+    'contenteditable', # Contenteditable divs
+    'electron',       # Electron apps (VS Code, Discord)
+    'afx:',           # MFC apps (Microsoft Office)
+    '_wndclass_',     # Custom text controls
+    'directuihwnd',   # Modern Windows UI
+    'windows.ui.core', # UWP text controls
+)
+
+# Title keywords of apps that usually have text fields, with their score
+TEXT_APP_KEYWORDS = {
+    # Text editors
+    'notepad': 30, 'wordpad': 30, 'word': 30, 'excel': 30,
+    'visual studio code': 35, 'code': 20, 'vscode': 35,
+    'sublime': 35, 'atom': 35, 'vim': 35, 'emacs': 35,
+    'notepad++': 35, 'brackets': 35, 'gedit': 35,
+
+    # Browsers (usually have text fields)
+    'chrome': 25, 'firefox': 25, 'edge': 25, 'brave': 25,
+    'opera': 25, 'safari': 25, 'vivaldi': 25,
+
+    # Communication apps
+    'discord': 30, 'slack': 30, 'teams': 30, 'zoom': 25,
+    'telegram': 30, 'whatsapp': 30, 'signal': 30,
+    'messenger': 30, 'skype': 25,
+
+    # Note-taking apps
+    'obsidian': 35, 'notion': 35, 'evernote': 35,
+    'onenote': 35, 'typora': 35, 'bear': 35,
+    'roam': 35, 'logseq': 35, 'remnote': 35,
+
+    # IDEs
+    'pycharm': 35, 'intellij': 35, 'webstorm': 35,
+    'rider': 35, 'eclipse': 35, 'netbeans': 35,
+    'android studio': 35,
+
+    # Office apps
+    'outlook': 25, 'thunderbird': 30, 'gmail': 25,
+    'docs': 30, 'sheets': 25, 'slides': 25,
+
+    # Other
+    'terminal': 30, 'powershell': 30, 'cmd': 30,
+    'git': 20, 'sql': 25, 'database': 20,
+}
+
+# Taskbar and system tray elements are never text fields
+TASKBAR_CLASSES = frozenset(('shell_traywnd', 'button', 'tooltips_class32', 'shell_secondarytraywnd'))
+
+ES_PASSWORD = 0x0020  # Edit control style of password boxes
+
+screen_size_cache = None  # (timestamp, (width, height))
+
+def get_screen_size():
+    """Primary screen size, cached briefly (resolution changes are rare)"""
+    global screen_size_cache
+    now = time.monotonic()
+    if screen_size_cache is None or now - screen_size_cache[0] > SCREEN_SIZE_CACHE_TTL:
+        user32 = ctypes.windll.user32
+        screen_size_cache = (now, (user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)))
+    return screen_size_cache[1]
+
 # --- Status Widget (appears only during recording/transcribing)
 class RecordingWidget:
     def __init__(self):
@@ -380,7 +628,7 @@ class RecordingWidget:
     def update_duration(self):
         """Update recording duration"""
         if is_recording:
-            duration = time.time() - recording_start_time
+            duration = time.monotonic() - recording_start_time
             self.status_label.config(text=f"Recording {duration:.1f}s")
             self.update_job = self.root.after(100, self.update_duration)
     
@@ -421,6 +669,12 @@ class RecordingWidget:
         self.volume_bar.pack_forget()  # Hide volume bar
         self.root.update()
     
+    def show_progress(self, text):
+        """Show partial transcription while segments are decoded"""
+        preview = ("..." if len(text) > 35 else "") + text[-35:]
+        self.status_label.config(text=preview)
+        self.root.update()
+    
     def show_result(self, text, word_count):
         """Show transcription result"""
         self.frame.config(bg='#27ae60')
@@ -468,66 +722,35 @@ def is_fullscreen_game():
         if not hwnd:
             return False
         
-        # Get window title and class
-        title = win32gui.GetWindowText(hwnd).lower()
+        # Check class name first - needs no geometry
         class_name = win32gui.GetClassName(hwnd).lower()
+        for game_class in GAME_WINDOW_CLASSES:
+            if game_class in class_name:
+                log_debug("Fullscreen game detected (class): %s", class_name)
+                return True
         
-        # Get window rect
+        # Check if window is fullscreen (covers entire screen)
         rect = win32gui.GetWindowRect(hwnd)
         width = rect[2] - rect[0]
         height = rect[3] - rect[1]
+        screen_width, screen_height = get_screen_size()
         
-        # Get screen dimensions
-        screen_width = ctypes.windll.user32.GetSystemMetrics(0)
-        screen_height = ctypes.windll.user32.GetSystemMetrics(1)
+        if width < screen_width - 10 or height < screen_height - 10:
+            return False
         
-        # Check if window is fullscreen (covers entire screen)
-        is_fullscreen = (width >= screen_width - 10 and height >= screen_height - 10)
-        
-        # Common game engine class names
-        game_classes = [
-            'unitywindowclass',  # Unity games
-            'unrealwindow',      # Unreal Engine
-            'sdl_app',           # SDL games
-            'd3d',               # DirectX
-            'opengl',            # OpenGL
-            'gameoverlayui',     # Steam overlay
-        ]
-        
-        # Common game keywords in titles
-        game_keywords = [
-            'game', 'steam', 'epic', 'origin', 'uplay', 'gog',
-            'league of legends', 'valorant', 'fortnite', 'minecraft',
-            'counter-strike', 'dota', 'overwatch', 'apex', 'warzone',
-            'rocket league', 'genshin', 'final fantasy', 'world of warcraft',
-            'destiny', 'battlefield', 'call of duty', 'assassin', 'cyberpunk',
-            'the witcher', 'elden ring', 'dark souls', 'starcraft', 'diablo'
-        ]
-        
-            # Check class name
-        for game_class in game_classes:
-            if game_class in class_name:
-                log_debug(f"Fullscreen game detected (class): {class_name}")
+        # Fullscreen AND has game keywords in title
+        title = win32gui.GetWindowText(hwnd).lower()
+        for keyword in GAME_TITLE_KEYWORDS:
+            if keyword in title:
+                log_debug("Fullscreen game detected (title): %.50s", title)
                 return True
         
-        # Check if fullscreen AND has game keywords in title
-        if is_fullscreen:
-            for keyword in game_keywords:
-                if keyword in title:
-                    log_debug(f"Fullscreen game detected (title): {title[:50]}")
-                    return True
-            
-            # Generic fullscreen detection (no menu bar, fullscreen size)
-            # Exclude known desktop apps
-            desktop_keywords = ['explorer', 'taskbar', 'chrome', 'firefox', 'edge', 
-                              'code', 'visual studio', 'notepad', 'word', 'excel']
-            
-            is_desktop_app = any(kw in title for kw in desktop_keywords)
-            
-            if not is_desktop_app:
-                # Likely a game or video player in fullscreen
-                log_debug(f"Generic fullscreen app detected: {title[:50]}")
-                return True
+        # Generic fullscreen detection (no menu bar, fullscreen size)
+        # Exclude known desktop apps
+        if not any(kw in title for kw in DESKTOP_APP_KEYWORDS):
+            # Likely a game or video player in fullscreen
+            log_debug("Generic fullscreen app detected: %.50s", title)
+            return True
         
         return False
         
@@ -536,6 +759,26 @@ def is_fullscreen_game():
         return False
 
 def is_text_field():
+    """Text field check, memoized briefly per (foreground window, focused control)"""
+    global text_field_cache
+    
+    hwnd = win32gui.GetForegroundWindow()
+    # Left zeroed (no focus) if the query fails
+    gui_info = GUITHREADINFO()
+    gui_info.cbSize = ctypes.sizeof(GUITHREADINFO)
+    ctypes.windll.user32.GetGUIThreadInfo(0, ctypes.byref(gui_info))
+    
+    key = (hwnd, gui_info.hwndFocus)
+    now = time.monotonic()
+    cached = text_field_cache
+    if cached and cached[1] == key and now - cached[0] < TEXT_FIELD_CACHE_TTL:
+        return cached[2]
+    
+    detected = detect_text_field(hwnd, gui_info)
+    text_field_cache = (now, key, detected)
+    return detected
+
+def detect_text_field(hwnd, gui_info):
     """Comprehensive text field detection - checks multiple signals"""
     try:
         detected = False
@@ -543,109 +786,37 @@ def is_text_field():
         score = 0  # Confidence score
         
         # Get window info
-        hwnd = win32gui.GetForegroundWindow()
         title = win32gui.GetWindowText(hwnd) if hwnd else ""
         class_name = ""
         cursor_handle = 0
         
         # Method 1: Check cursor type (I-beam = text cursor) - STRONGEST SIGNAL
-        class CURSORINFO(Structure):
-            _fields_ = [("cbSize", wintypes.DWORD),
-                       ("flags", wintypes.DWORD),
-                       ("hCursor", wintypes.HANDLE),  # Use HANDLE instead of HCURSOR
-                       ("ptScreenPos", wintypes.POINT)]
-        
         cursor_info = CURSORINFO()
         cursor_info.cbSize = ctypes.sizeof(CURSORINFO)
         if ctypes.windll.user32.GetCursorInfo(ctypes.byref(cursor_info)):
             cursor_handle = cursor_info.hCursor
-            # I-beam cursor handles (varies by system/theme)
-            # Common values: 65541 (standard), 65567, 65559
-            # Arrow cursor: 65543, Hand: 65567
-            ibeam_handles = [65541, 65567, 65559, 65553]
-            if cursor_handle in ibeam_handles:
+            if cursor_handle in IBEAM_CURSOR_HANDLES:
                 score += 50  # Strong indicator
                 detection_method = f"I-beam cursor ({cursor_handle})"
         
         # Method 2: Get focused control class name
-        gui_info = GUITHREADINFO()
-        gui_info.cbSize = ctypes.sizeof(GUITHREADINFO)
-        if ctypes.windll.user32.GetGUIThreadInfo(0, ctypes.byref(gui_info)):
-            if gui_info.hwndFocus:
-                try:
-                    class_name = win32gui.GetClassName(gui_info.hwndFocus)
-                    
-                    # Comprehensive list of text field class names
-                    text_classes = [
-                        'edit',           # Standard Windows edit control
-                        'richedit',       # Rich edit controls
-                        'richedit20',     # Rich edit 2.0+
-                        'scintilla',      # Scintilla editor (Notepad++, VS Code)
-                        'chrome_renderwidgethost', # Chrome/Edge text fields
-                        'chrome_widgetwin',        # Chrome windows
-                        'mozilla',        # Firefox
-                        'gecko',          # Firefox engine
-                        'textfield',      # Generic text field
-                        'textarea',       # Textarea elements
-                        'input',          # Input elements
-                        'edit control',   # Edit controls
-                        'text',           # General text controls
-                        'contenteditable', # Contenteditable divs
-                        'electron',       # Electron apps (VS Code, Discord)
-                        'afx:',           # MFC apps (Microsoft Office)
-                        '_wndclass_',     # Custom text controls
-                        'directuihwnd',   # Modern Windows UI
-                        'windows.ui.core', # UWP text controls
-                    ]
-                    
-                    class_lower = class_name.lower()
-                    for text_class in text_classes:
-                        if text_class in class_lower:
-                            score += 40
-                            if not detection_method:
-                                detection_method = f"Class: {class_name}"
-                            break
-                except:
-                    pass
+        if gui_info.hwndFocus:
+            try:
+                class_name = win32gui.GetClassName(gui_info.hwndFocus)
+                
+                class_lower = class_name.lower()
+                for text_class in TEXT_CONTROL_CLASSES:
+                    if text_class in class_lower:
+                        score += 40
+                        if not detection_method:
+                            detection_method = f"Class: {class_name}"
+                        break
+            except:
+                pass
         
         # Method 3: Check application window title - SUPPLEMENTARY
-        apps_and_keywords = {
-            # Text editors
-            'notepad': 30, 'wordpad': 30, 'word': 30, 'excel': 30,
-            'visual studio code': 35, 'code': 20, 'vscode': 35,
-            'sublime': 35, 'atom': 35, 'vim': 35, 'emacs': 35,
-            'notepad++': 35, 'brackets': 35, 'gedit': 35,
-            
-            # Browsers (usually have text fields)
-            'chrome': 25, 'firefox': 25, 'edge': 25, 'brave': 25,
-            'opera': 25, 'safari': 25, 'vivaldi': 25,
-            
-            # Communication apps
-            'discord': 30, 'slack': 30, 'teams': 30, 'zoom': 25,
-            'telegram': 30, 'whatsapp': 30, 'signal': 30,
-            'messenger': 30, 'skype': 25,
-            
-            # Note-taking apps
-            'obsidian': 35, 'notion': 35, 'evernote': 35,
-            'onenote': 35, 'typora': 35, 'bear': 35,
-            'roam': 35, 'logseq': 35, 'remnote': 35,
-            
-            # IDEs
-            'pycharm': 35, 'intellij': 35, 'webstorm': 35,
-            'rider': 35, 'eclipse': 35, 'netbeans': 35,
-            'android studio': 35,
-            
-            # Office apps
-            'outlook': 25, 'thunderbird': 30, 'gmail': 25,
-            'docs': 30, 'sheets': 25, 'slides': 25,
-            
-            # Other
-            'terminal': 30, 'powershell': 30, 'cmd': 30,
-            'git': 20, 'sql': 25, 'database': 20,
-        }
-        
         title_lower = title.lower()
-        for app, points in apps_and_keywords.items():
+        for app, points in TEXT_APP_KEYWORDS.items():
             if app in title_lower:
                 score += points
                 if not detection_method:
@@ -659,18 +830,17 @@ def is_text_field():
                 detection_method = "Caret detected"
         
         # Method 5: Additional window style checks
-        if hwnd:
+        # Styles can only add 15 points, so skip the query when 60 is out of reach
+        if hwnd and score >= 45:
             try:
-                # Get window style
+                # Get window style (the extended style carries no text field hints)
                 style = ctypes.windll.user32.GetWindowLongW(hwnd, -16)  # GWL_STYLE
-                ex_style = ctypes.windll.user32.GetWindowLongW(hwnd, -20)  # GWL_EXSTYLE
                 
                 # ES_MULTILINE, ES_READONLY, ES_PASSWORD indicators
                 # ES_MULTILINE
                 if style & 0x0004:
                     score += 15
                 # ES_PASSWORD (don't auto-start on password fields)
-                ES_PASSWORD = 0x0020
                 if style & ES_PASSWORD:
                     # Strong indicator this is a password field; subtract score or mark
                     score -= 100
@@ -678,18 +848,18 @@ def is_text_field():
                 pass
         
         # Check if it's taskbar or system tray (ignore these)
-        taskbar_classes = ['shell_traywnd', 'button', 'tooltips_class32', 'shell_secondarytraywnd']
-        if class_name.lower() in taskbar_classes or 'taskbar' in title.lower() or 'tray' in class_name.lower():
-            log_debug(f"Ignoring taskbar/system element: {class_name}")
+        class_lower = class_name.lower()
+        if class_lower in TASKBAR_CLASSES or 'taskbar' in title_lower or 'tray' in class_lower:
+            log_debug("Ignoring taskbar/system element: %s", class_name)
             return False
         
         # Decision threshold - increased to reduce false positives
         detected = score >= 60  # Need at least 60 points to confirm text field (was 40)
         
         if detected:
-            log_info(f"✓ Text field detected (score: {score}) via {detection_method}")
+            log_info("✓ Text field detected (score: %d) via %s", score, detection_method)
         else:
-            log_debug(f"✗ Not a text field (score: {score}) - Window: '{title[:40]}', Class: '{class_name}', Cursor: {cursor_handle}")
+            log_debug("✗ Not a text field (score: %d) - Window: '%.40s', Class: '%s', Cursor: %s", score, title, class_name, cursor_handle)
         
         return detected
         
@@ -698,31 +868,107 @@ def is_text_field():
         # When error occurs, be conservative - don't allow
         return False
 
+def reset_audio_buffer():
+    """Preallocate the recording buffer for the configured max recording time"""
+    global audio_buffer, audio_buffer_pos, audio_sum_squares
+    
+    max_time = config_manager.get('max_recording_time')
+    # One second of headroom: the first block holds audio from before the start and the
+    # max-time stop lands a block late. 60s default when unlimited; grown on demand by the callback
+    capacity = int(capture_sample_rate * (max_time + 1 if max_time > 0 else 60))
+    if len(audio_buffer) != capacity:
+        audio_buffer = np.empty(capacity, dtype=np.int16)
+    audio_buffer_pos = 0
+    audio_sum_squares = 0.0
+
+def pcm16_to_float32(samples):
+    """Convert int16 PCM to the float32 [-1, 1) input Whisper expects (always a copy)"""
+    audio = samples.astype(np.float32)
+    audio *= INT16_SCALE
+    return audio
+
+def prepare_for_whisper(samples):
+    """Convert captured int16 PCM to 16 kHz float32 with a single polyphase resample if needed"""
+    audio = pcm16_to_float32(samples)
+    if capture_sample_rate != SAMPLE_RATE:
+        audio = resample_poly(audio, SAMPLE_RATE, capture_sample_rate).astype(np.float32, copy=False)
+    return audio
+
+def query_capture_sample_rate():
+    """Native sample rate of the default input device, so PortAudio does not resample"""
+    try:
+        info = sd.query_devices(kind='input')
+        return int(info['default_samplerate'])
+    except Exception as e:
+        log_debug(f"Input device query failed: {e}")
+        return SAMPLE_RATE
+
 def audio_callback(indata, frames, time_info, status_flag):
-    """Sounddevice callback - thread-safe with volume monitoring"""
-    global current_volume, last_silence_time
+    """Sounddevice (raw) callback - thread-safe with volume monitoring"""
+    global current_volume, last_silence_time, audio_buffer, audio_buffer_pos, audio_sum_squares
     
     try:
         if status_flag:
-            log_debug(f"Audio callback status: {status_flag}")
+            log_debug("Audio callback status: %s", status_flag)
         
         if is_recording:
-            audio_queue.put(indata.copy())
+            # View the raw PortAudio buffer without allocating a copy
+            samples = np.frombuffer(indata, dtype=np.int16, count=frames)
+            
+            start = audio_buffer_pos
+            end = start + frames
+            if end > len(audio_buffer):
+                # Unlimited recording outgrew the buffer - double it
+                grown = np.empty(max(end, len(audio_buffer) * 2), dtype=np.int16)
+                grown[:start] = audio_buffer[:start]
+                audio_buffer = grown
+            np.copyto(audio_buffer[start:end], samples)
+            audio_buffer_pos = end
             
-            # Calculate current volume (RMS)
-            current_volume = np.sqrt(np.mean(indata**2))
+            # Calculate current volume (RMS, on the float scale)
+            mean_square = np.mean(np.square(samples, dtype=np.float32))
+            current_volume = np.sqrt(mean_square) * INT16_SCALE
+            audio_sum_squares += mean_square * frames
             
             # Track silence for auto-stop
             if config_manager.get('enable_silence_auto_stop'):
                 volume_threshold = config_manager.get('volume_threshold')
                 if current_volume < volume_threshold:
                     if last_silence_time == 0:
-                        last_silence_time = time.time()
+                        last_silence_time = time.monotonic()
                 else:
                     last_silence_time = 0
+            
+            # Check auto-stop conditions on every block (no polling thread)
+            check_recording_limits()
     except Exception as e:
         log_error(f"Audio callback error: {e}", e)
 
+def check_recording_limits():
+    """Trigger auto-stop on silence timeout or max duration - called from the audio callback"""
+    global auto_stopped
+    
+    if auto_stopped:
+        return
+    
+    now = time.monotonic()
+    silence_duration = config_manager.get('silence_duration')
+    max_time = config_manager.get('max_recording_time')
+    
+    # Check configurable silence timeout
+    if (config_manager.get('enable_silence_auto_stop') and silence_duration > 0
+            and last_silence_time > 0 and now - last_silence_time > silence_duration):
+        log_info("Auto-stopping after %ss of silence", silence_duration)
+    # Check max recording time
+    elif max_time > 0 and now - recording_start_time >= max_time:
+        log_info("Auto-stopping after %ss max duration", max_time)
+    else:
+        return
+    
+    auto_stopped = True
+    # Never block the realtime audio thread - stop on a worker
+    threading.Thread(target=stop_recording, daemon=True).start()
+
 def play_sound(sound_type):
     """Play enhanced audio feedback"""
     if not config_manager.get('enable_audio_feedback'):
@@ -742,7 +988,7 @@ def play_sound(sound_type):
             winsound.Beep(freq, duration)
             time.sleep(0.05)
     except Exception as e:
-        log_debug(f"Sound playback error: {e}")
+        log_debug("Sound playback error: %s", e)
 
 def recording_beep_loop():
     """Play soft beeps during recording"""
@@ -757,6 +1003,7 @@ def recording_beep_loop():
 def start_recording():
     """Start recording with advanced features"""
     global is_recording, recording_start_time, beep_thread, stop_beeping, last_silence_time, auto_stopped, original_focused_hwnd
+    global streaming_session
     
     try:
         with recording_lock:
@@ -774,19 +1021,28 @@ def start_recording():
                 gui_info.cbSize = ctypes.sizeof(GUITHREADINFO)
                 if ctypes.windll.user32.GetGUIThreadInfo(0, ctypes.byref(gui_info)):
                     original_focused_hwnd = gui_info.hwndFocus
-                    log_debug(f"Stored original focus: {original_focused_hwnd}")
+                    log_debug("Stored original focus: %s", original_focused_hwnd)
             except Exception as e:
-                log_debug(f"Failed to store focused hwnd: {e}")
+                log_debug("Failed to store focused hwnd: %s", e)
                 original_focused_hwnd = None
             
-            # Clear audio queue
-            while not audio_queue.empty():
-                audio_queue.get()
+            # Reset audio buffer
+            reset_audio_buffer()
             
-            is_recording = True
-            recording_start_time = time.time()
+            # Streaming state belongs to this recording only (a worker from a previous one may still be decoding)
+            # The worker transcribes full windows while recording
+            session = None
+            if config_manager.get('enable_streaming_transcription'):
+                session = StreamingTranscription(capture_sample_rate)
+                session.thread.start()
+            streaming_session = session
+            
+            # Reset per-recording state first: the audio callback reads it without the lock
+            # as soon as is_recording is set, so the flag must be the last write
+            recording_start_time = time.monotonic()
             last_silence_time = 0
             auto_stopped = False
+            is_recording = True
         
         # Play start sound
         threading.Thread(target=play_sound, args=('start',), daemon=True).start()
@@ -796,13 +1052,9 @@ def start_recording():
         beep_thread = threading.Thread(target=recording_beep_loop, daemon=True)
         beep_thread.start()
         
-        # Start auto-stop monitor (if silence auto-stop enabled or max time set)
+        # Auto-stop (silence / max time) is checked by the audio callback
         silence_enabled = config_manager.get('enable_silence_auto_stop')
         silence_duration = config_manager.get('silence_duration')
-        max_time = config_manager.get('max_recording_time')
-        
-        if (silence_enabled and silence_duration > 0) or max_time > 0:
-            threading.Thread(target=auto_stop_monitor, daemon=True).start()
         
         status_widget.show_recording()
         
@@ -814,7 +1066,7 @@ def start_recording():
             stop_methods.append(f"auto-stop after {silence_duration}s silence")
         
         stop_msg = ", ".join(stop_methods) if stop_methods else "Recording..."
-        log_info(f"Recording started - {stop_msg}, Right-click to cancel")
+        log_info("Recording started - %s, Right-click to cancel", stop_msg)
     
     except Exception as e:
         log_error(f"Failed to start recording: {e}", e)
@@ -824,40 +1076,67 @@ def start_recording():
             time.sleep(2)
             status_widget.hide()
 
-def auto_stop_monitor():
-    """Monitor for auto-stop conditions"""
-    global auto_stopped
+class StreamingTranscription:
+    """Streaming state of one recording, shared by its worker and its final transcription"""
+    def __init__(self, sample_rate):
+        self.sample_rate = sample_rate
+        self.stop_event = threading.Event()  # Set on stop/cancel so the worker exits promptly
+        self.text_parts = []  # Text of windows already transcribed
+        self.committed_pos = 0  # audio_buffer position up to which audio has been transcribed
+        self.thread = threading.Thread(target=streaming_transcription_loop, args=(self,), daemon=True)
+
+def find_quiet_cut(samples, search_len, frame_len):
+    """Index just past the quietest frame in the last search_len samples - a cut point between words"""
+    tail = samples[-search_len:]
+    frames = len(tail) // frame_len
+    blocks = tail[:frames * frame_len].astype(np.float32).reshape(frames, frame_len)
+    quietest = int(np.argmin(np.einsum('ij,ij->i', blocks, blocks)))
+    return len(samples) - len(tail) + (quietest + 1) * frame_len
+
+def streaming_transcription_loop(session):
+    """Transcribe complete windows while recording so stop only has to decode the tail"""
+    window = session.sample_rate * STREAMING_WINDOW_S
+    search = session.sample_rate * STREAMING_CUT_SEARCH_S
+    frame = session.sample_rate // 50  # 20 ms
     
     try:
-        silence_enabled = config_manager.get('enable_silence_auto_stop')
-        silence_duration = config_manager.get('silence_duration')
-        max_time = config_manager.get('max_recording_time')
-        
-        while is_recording:
-            # Check configurable silence timeout
-            if silence_enabled and silence_duration > 0 and last_silence_time > 0:
-                if time.time() - last_silence_time > silence_duration:
-                    log_info(f"Auto-stopping after {silence_duration}s of silence")
-                    auto_stopped = True
-                    stop_recording()
-                    break
-            
-            # Check max recording time
-            if max_time > 0:
-                duration = time.time() - recording_start_time
-                if duration >= max_time:
-                    log_info(f"Auto-stopping after {max_time}s max duration")
-                    auto_stopped = True
-                    stop_recording()
-                    break
-            
-            time.sleep(0.1)
+        while not session.stop_event.wait(STREAMING_POLL_S):
+            while True:
+                with recording_lock:
+                    # Once stopped, the buffer may already belong to the next recording
+                    if session.stop_event.is_set():
+                        return
+                    available = audio_buffer_pos  # Read before the buffer: a grown buffer keeps older samples
+                    start = session.committed_pos
+                    if available - start < window:
+                        break
+                    pcm = audio_buffer[start:start + window].copy()
+                
+                # End the window in a pause instead of mid-word; the rest starts the next window
+                cut = find_quiet_cut(pcm, search, frame)
+                chunk = prepare_for_whisper(pcm[:cut])
+                
+                segments, _ = model.transcribe(
+                    chunk,
+                    language="en",
+                    beam_size=1,
+                    vad_filter=True,
+                    without_timestamps=True,
+                    condition_on_previous_text=False
+                )
+                for segment in segments:
+                    segment_text = segment.text.strip()
+                    if len(segment_text) >= 2:
+                        session.text_parts.append(segment_text)
+                
+                session.committed_pos = start + cut
+                log_debug("Streaming: transcribed window ending at %.1fs", session.committed_pos / session.sample_rate)
     except Exception as e:
-        log_error(f"Auto-stop monitor error: {e}", e)
+        log_error(f"Streaming transcription error: {e}", e)
 
 def stop_recording():
     """Stop recording and transcribe"""
-    global is_recording, stop_beeping
+    global is_recording, stop_beeping, streaming_session
     
     try:
         with recording_lock:
@@ -865,21 +1144,25 @@ def stop_recording():
                 return
             is_recording = False
             stop_beeping = True
+            session = streaming_session
+            streaming_session = None
+            if session:
+                session.stop_event.set()
+            # Copy out the audio still to be decoded before a new recording can reuse the buffer
+            # (streaming mode: only what the worker has not committed yet)
+            pcm_start = session.committed_pos if session else 0
+            pcm = audio_buffer[pcm_start:audio_buffer_pos].copy()
+            duration = audio_buffer_pos / capture_sample_rate
+            avg_volume = np.sqrt(audio_sum_squares / max(audio_buffer_pos, 1)) * INT16_SCALE
         
         # Play stop sound
         threading.Thread(target=play_sound, args=('stop',), daemon=True).start()
         
         status_widget.show_processing()
         
-        # Collect audio from queue
-        audio_frames = []
-        while not audio_queue.empty():
-            audio_frames.append(audio_queue.get())
-        
-        duration = len(audio_frames) * 0.03
         log_info(f"Recorded {duration:.1f}s, transcribing...")
         
-        if len(audio_frames) < 10:
+        if duration < 0.3:
             log_info("Recording too short, ignoring")
             status_widget.show_error("TOO SHORT")
             time.sleep(1.5)
@@ -887,7 +1170,7 @@ def stop_recording():
             return
         
         # Transcribe
-        threading.Thread(target=transcribe_audio, args=(audio_frames,), daemon=True).start()
+        threading.Thread(target=transcribe_audio, args=(pcm, pcm_start, duration, avg_volume, session), daemon=True).start()
     
     except Exception as e:
         log_error(f"Failed to stop recording: {e}", e)
@@ -897,17 +1180,19 @@ def stop_recording():
 
 def cancel_recording():
     """Cancel recording without transcribing"""
-    global is_recording, stop_beeping
+    global is_recording, stop_beeping, audio_buffer_pos, streaming_session
     
     with recording_lock:
         if not is_recording:
             return
         is_recording = False
         stop_beeping = True
+        if streaming_session:
+            streaming_session.stop_event.set()
+            streaming_session = None
     
-    # Clear audio queue
-    while not audio_queue.empty():
-        audio_queue.get()
+    # Discard recorded audio
+    audio_buffer_pos = 0
     
     # Play cancel sound
     threading.Thread(target=play_sound, args=('cancel',), daemon=True).start()
@@ -918,65 +1203,154 @@ def cancel_recording():
     time.sleep(1.5)
     status_widget.hide()
 
-def transcribe_audio(frames):
-    """Transcribe audio - filters background chatter with advanced features"""
+def open_clipboard():
+    """Open the clipboard, retrying while another process holds it"""
+    # Contention usually clears within a millisecond or two: start with a 1 ms
+    # spin and back off to 50 ms (about 0.3 s in total) for slow clipboard managers
+    for attempt in range(CLIPBOARD_OPEN_ATTEMPTS):
+        try:
+            win32clipboard.OpenClipboard()
+            return
+        except pywintypes.error:
+            if attempt == CLIPBOARD_OPEN_ATTEMPTS - 1:
+                raise
+            time.sleep(min(0.001 * 2 ** attempt, 0.05))
+
+def set_clipboard_text(text):
+    """Put text on the clipboard via Win32"""
+    open_clipboard()
+    try:
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardText(text, win32con.CF_UNICODETEXT)
+    finally:
+        win32clipboard.CloseClipboard()
+
+def key_input(vk, flags=0):
+    """Build a keyboard INPUT record for SendInput"""
+    scan = ctypes.windll.user32.MapVirtualKeyW(vk, 0)  # MAPVK_VK_TO_VSC
+    return INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags))
+
+def send_paste_shortcut():
+    """Send Ctrl+V as one atomic SendInput batch (down/down/up/up)"""
+    global paste_inputs
+    if paste_inputs is None:
+        # Built once and reused - the records never change
+        paste_inputs = (INPUT * 4)(
+            key_input(VK_CONTROL),
+            key_input(VK_V),
+            key_input(VK_V, KEYEVENTF_KEYUP),
+            key_input(VK_CONTROL, KEYEVENTF_KEYUP),
+        )
+    sent = ctypes.windll.user32.SendInput(len(paste_inputs), paste_inputs, ctypes.sizeof(INPUT))
+    if sent != len(paste_inputs):
+        raise ctypes.WinError()
+
+def type_text(text):
+    """Type text as a single SendInput batch of UTF-16 code units (no per-character delay)"""
+    global type_inputs
+    data = text.encode('utf-16-le')
+    units = [int.from_bytes(data[i:i + 2], 'little') for i in range(0, len(data), 2)]
+    
+    # Reuse the INPUT array across calls, growing it only when needed
+    count = 2 * len(units)
+    if count > len(type_inputs):
+        type_inputs = (INPUT * count)()
+    inputs = type_inputs
+    
+    for i, unit in enumerate(units):
+        down = inputs[2 * i]
+        up = inputs[2 * i + 1]
+        down.type = up.type = INPUT_KEYBOARD
+        vk = TYPE_TEXT_VIRTUAL_KEYS.get(unit)
+        if vk:
+            # Some controls ignore Unicode CR/TAB - send the real keys
+            down.ki.wVk = up.ki.wVk = vk
+            down.ki.wScan = up.ki.wScan = 0
+            down.ki.dwFlags = 0
+            up.ki.dwFlags = KEYEVENTF_KEYUP
+        else:
+            down.ki.wVk = up.ki.wVk = 0
+            down.ki.wScan = up.ki.wScan = unit
+            down.ki.dwFlags = KEYEVENTF_UNICODE
+            up.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+    
+    sent = ctypes.windll.user32.SendInput(count, inputs, ctypes.sizeof(INPUT))
+    if sent != count:
+        raise ctypes.WinError()
+
+def wait_for_foreground(hwnd, timeout):
+    """Poll until hwnd is the foreground window; returns False after timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while win32gui.GetForegroundWindow() != hwnd:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+def transcribe_audio(pcm, pcm_start, duration, avg_volume, session=None):
+    """Transcribe captured int16 PCM (from buffer position pcm_start) - filters background chatter with advanced features"""
     global model
     
     try:
         # Store the active window before showing processing widget
         active_window = win32gui.GetForegroundWindow()
         
-        # Combine audio
-        audio = np.concatenate(frames, axis=0).flatten().astype(np.float32)
-        
-        # Normalize
-        max_val = np.abs(audio).max()
-        if max_val > 0:
-            audio = audio / max_val
-        
-        duration = len(audio) / SAMPLE_RATE
-        avg_volume = np.sqrt(np.mean(audio**2))
-        
-        log_info(f"Processing {duration:.1f}s (avg volume: {avg_volume:.4f})...")
-        
-        # Transcribe with advanced VAD
-        segments, info = model.transcribe(
-            audio,
-            language="en",
-            beam_size=5,
-            temperature=0.0,
-            best_of=1,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_speech_duration_ms=500,
-                max_speech_duration_s=30,
-                min_silence_duration_ms=500,
-                speech_pad_ms=300
-            ),
-            condition_on_previous_text=False,
-            compression_ratio_threshold=2.0,
-            log_prob_threshold=-0.8,
-            no_speech_threshold=0.5
-        )
+        # Streaming mode: windows already transcribed during recording, decode only the tail
+        text_parts = []
+        if session:
+            session.thread.join()
+            text_parts = list(session.text_parts)
+            pcm = pcm[session.committed_pos - pcm_start:]
+            log_info(f"Processing {len(pcm) / capture_sample_rate:.1f}s tail ({len(text_parts)} streamed segments, avg volume: {avg_volume:.4f})...")
+        else:
+            log_info(f"Processing {duration:.1f}s (avg volume: {avg_volume:.4f})...")
+        
+        # Convert/resample only the span that is actually decoded
+        audio = prepare_for_whisper(pcm)
+        
+        # Transcribe with advanced VAD (the streamed tail may be empty)
+        segments = []
+        if len(audio) > 0:
+            segments, info = model.transcribe(
+                audio,
+                language="en",
+                beam_size=5,
+                temperature=0.0,
+                best_of=1,
+                vad_filter=True,
+                vad_parameters=dict(
+                    min_speech_duration_ms=500,
+                    max_speech_duration_s=30,
+                    min_silence_duration_ms=500,
+                    speech_pad_ms=300
+                ),
+                condition_on_previous_text=False,
+                compression_ratio_threshold=2.0,
+                log_prob_threshold=-0.8,
+                no_speech_threshold=0.5
+            )
         
-        # Get text with word-level timing
-        text = ""
-        word_count = 0
+        # Segments are decoded lazily - show them as they arrive (throttled, the result follows anyway)
+        last_progress = 0.0
         for segment in segments:
             segment_text = segment.text.strip()
             if len(segment_text) < 2:
                 continue
-            text += segment_text + " "
-            word_count += len(segment_text.split())
+            text_parts.append(segment_text)
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_UPDATE_INTERVAL:
+                last_progress = now
+                status_widget.show_progress(" ".join(text_parts))
         
-        text = text.strip()
+        text = " ".join(text_parts)
+        word_count = len(text.split())
         
         if text:
             log_info(f"Transcription: '{text}' ({word_count} words)")
             
             # Copy to clipboard FIRST
             try:
-                pyperclip.copy(text)
+                set_clipboard_text(text)
                 log_info("✓ Copied to clipboard")
             except Exception as e:
                 log_error(f"Failed to copy to clipboard: {e}", e)
@@ -1013,47 +1387,35 @@ def transcribe_audio(frames):
                 status_widget.hide()
                 return
             
-            # Return focus to original window and wait for it to be ready
+            # Return focus to original window and wait (bounded) until it is actually active
             try:
                 win32gui.SetForegroundWindow(active_window)
-                time.sleep(0.3)  # Wait for window to become active
-                log_info("✓ Focus restored to original window")
+                if wait_for_foreground(active_window, timeout=0.3):
+                    log_info("✓ Focus restored to original window")
+                else:
+                    log_info("⚠ Original window did not become active - pasting anyway")
             except Exception as e:
                 log_error(f"Failed to restore focus: {e}", e)
-                time.sleep(0.2)
             
             # Try multiple methods to insert text
             insert_success = False
             
             # Method 1: Simulate Ctrl+V (paste from clipboard) - MOST RELIABLE
             try:
-                keyboard.press_and_release('ctrl+v')
-                time.sleep(0.05)
+                send_paste_shortcut()
                 insert_success = True
                 log_info("✓ Text pasted via Ctrl+V")
             except Exception as e:
                 log_error(f"Paste failed: {e}", e)
             
-            # Method 2: Direct keyboard typing (if paste failed)
+            # Method 2: Type directly via one SendInput batch (if paste failed)
             if not insert_success:
                 try:
-                    time.sleep(0.1)
-                    keyboard.write(text + " ")
+                    type_text(text + " ")
                     insert_success = True
-                    log_info("✓ Text typed via keyboard library")
+                    log_info("✓ Text typed via SendInput")
                 except Exception as e:
-                    log_error(f"Keyboard typing failed: {e}", e)
-            
-            # Method 3: Using pyautogui as fallback (if available)
-            if not insert_success:
-                try:
-                    import pyautogui
-                    time.sleep(0.1)
-                    pyautogui.typewrite(text + " ", interval=0.01)
-                    insert_success = True
-                    log_info("✓ Text typed via pyautogui")
-                except Exception as e:
-                    log_debug(f"Pyautogui typing failed: {e}")
+                    log_error(f"SendInput typing failed: {e}", e)
             
             if not insert_success:
                 log_info("⚠ Auto-type failed - text is in clipboard, paste with Ctrl+V")
@@ -1073,33 +1435,163 @@ def transcribe_audio(frames):
         time.sleep(2)
         status_widget.hide()
 
+def handle_focus_change():
+    """Auto-start recording if the newly focused control is a text field"""
+    if is_recording:
+        return
+    # Give the focus a moment to settle
+    time.sleep(config_manager.get('auto_start_delay'))
+    if is_text_field():
+        log_debug("Focus monitor: text field focused")
+        if config_manager.get('auto_start_on_focus') and not is_recording:
+            start_recording()
+
+def focus_dispatch_loop():
+    """Background thread: handle queued focus changes so detection never waits on start_recording"""
+    while not focus_monitor_stop:
+        hwnd = focus_event_queue.get()
+        # Only the most recent focus matters - skip anything superseded
+        while not focus_event_queue.empty():
+            hwnd = focus_event_queue.get_nowait()
+        if hwnd is None or focus_monitor_stop:
+            break
+        try:
+            handle_focus_change()
+        except Exception as e:
+            log_debug("Focus event handler error: %s", e)
+
+def queue_focus_change(hwnd):
+    """Hand a focus change to the dispatcher (dropped if it is backed up)"""
+    try:
+        focus_event_queue.put_nowait(hwnd)
+    except Full:
+        log_debug("Focus event queue full - dropping event")
+
 def focus_monitor():
-    """Background thread: monitor foreground focus and auto-start recording when a text field is focused."""
-    global focus_monitor_stop
+    """Background thread: wait for foreground-window change events and auto-start recording when a text field is focused."""
+    global focus_monitor_thread_id
+    last_focused_hwnd = None
+    user32 = ctypes.windll.user32
+    
+    threading.Thread(target=focus_dispatch_loop, daemon=True).start()
+
+    def on_focus_event(hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        global text_field_cache
+        nonlocal last_focused_hwnd
+        if focus_monitor_stop or not hwnd or hwnd == last_focused_hwnd:
+            return
+        last_focused_hwnd = hwnd
+        text_field_cache = None  # Window changed - never reuse the previous detection
+        # Nothing to auto-start while a recording is running
+        if not is_recording:
+            queue_focus_change(hwnd)
+
+    # Keep a reference to the ctypes callback for the lifetime of the hook
+    proc = WINEVENTPROC(on_focus_event)
+    # Foreground changes only, like the polling fallback (not every control gaining focus inside an app)
+    hook = user32.SetWinEventHook(EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND, 0, proc, 0, 0, WINEVENT_OUTOFCONTEXT)
+    if not hook:
+        log_info("Focus event hook unavailable - falling back to polling")
+        focus_monitor_poll()
+        return
+
+    try:
+        # Out-of-context hooks are delivered through this thread's message loop
+        focus_monitor_thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        msg = wintypes.MSG()
+        while not focus_monitor_stop and user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+    except Exception as e:
+        log_error(f"Focus monitor fatal error: {e}", e)
+    finally:
+        user32.UnhookWinEvent(hook)
+        focus_monitor_thread_id = None
+
+def focus_monitor_poll():
+    """Fallback focus monitor: poll the foreground window when the event hook cannot be installed."""
     last_focused_hwnd = None
-    debounce_time = config_manager.get('auto_start_delay')
+    idle_polls = 0
 
     try:
         while not focus_monitor_stop:
             try:
                 hwnd = win32gui.GetForegroundWindow()
                 if hwnd and hwnd != last_focused_hwnd:
-                    # Give the focus a moment to settle
-                    time.sleep(debounce_time)
-                    if is_text_field():
-                        log_debug("Focus monitor: text field focused")
-                        if config_manager.get('auto_start_on_focus') and not is_recording:
-                            start_recording()
+                    # Keep tracking mid-recording (like the hook) so a window switched to
+                    # while recording isn't treated as new after stop; just don't auto-start
+                    if not is_recording:
+                        queue_focus_change(hwnd)
                     last_focused_hwnd = hwnd
+                    idle_polls = 0
+                else:
+                    idle_polls = min(idle_polls + 1, FOCUS_POLL_IDLE_MAX)
             except Exception as e:
-                log_debug(f"Focus monitor iteration error: {e}")
+                log_debug("Focus monitor iteration error: %s", e)
 
-            time.sleep(0.15)
+            # Back off while focus is idle: doubles every 3 quiet polls, reset on any change
+            interval = min(FOCUS_POLL_MIN_S * 2 ** (idle_polls // 3), FOCUS_POLL_MAX_S)
+            focus_monitor_wakeup.wait(interval)
     except Exception as e:
         log_error(f"Focus monitor fatal error: {e}", e)
 
+def stop_focus_monitor():
+    """Stop the focus monitor thread (wakes the message loop with WM_QUIT)"""
+    global focus_monitor_stop
+    focus_monitor_stop = True
+    focus_monitor_wakeup.set()  # Wake the polling fallback
+    queue_focus_change(None)  # Wake the dispatcher
+    if focus_monitor_thread_id:
+        ctypes.windll.user32.PostThreadMessageW(focus_monitor_thread_id, WM_QUIT, 0, 0)
+    if focus_monitor_thread and focus_monitor_thread.is_alive():
+        focus_monitor_thread.join(timeout=0.5)
+
+def dump_history_entry(entry):
+    """Serialize one history entry to a JSON line (orjson when available)"""
+    if orjson:
+        return orjson.dumps(entry).decode('utf-8')
+    return json.dumps(entry)
+
+def load_history_entry(line):
+    """Parse one JSON history line (orjson when available)"""
+    if orjson:
+        return orjson.loads(line)
+    return json.loads(line)
+
+def write_history_file():
+    """Rewrite the history file with only the entries currently kept (caller holds history_lock)"""
+    global history_file_lines
+    # Write a sibling temp file and swap it in, so a crash never leaves a truncated history
+    tmp_file = HISTORY_FILE.with_suffix(HISTORY_FILE.suffix + '.tmp')
+    tmp_file.write_text("".join(dump_history_entry(entry) + "\n" for entry in transcription_history), encoding='utf-8')
+    os.replace(tmp_file, HISTORY_FILE)
+    history_file_lines = len(transcription_history)
+
+def flush_history():
+    """Write pending history entries to disk in one go"""
+    global history_file_lines, history_flush_timer
+    try:
+        with history_lock:
+            history_flush_timer = None
+            if not history_pending:
+                return
+            
+            # Append just the new entries; compact once the file holds twice the kept entries
+            if history_file_lines + len(history_pending) > 2 * transcription_history.maxlen:
+                write_history_file()
+            else:
+                with HISTORY_FILE.open('a', encoding='utf-8') as f:
+                    f.write("".join(dump_history_entry(entry) + "\n" for entry in history_pending))
+                history_file_lines += len(history_pending)
+            
+            log_debug("Flushed %d history entries", len(history_pending))
+            history_pending.clear()
+    except Exception as e:
+        log_error(f"Failed to save history: {e}", e)
+
 def save_to_history(text, duration, volume, word_count):
-    """Save transcription to history"""
+    """Save transcription to history (written to disk by a debounced background flush)"""
+    global history_flush_timer
     try:
         entry = {
             'timestamp': datetime.now().isoformat(),
@@ -1110,13 +1602,16 @@ def save_to_history(text, duration, volume, word_count):
             'auto_stopped': bool(auto_stopped)  # Convert to Python bool
         }
         
-        transcription_history.append(entry)
-        
-        # Save to file
-        history_list = list(transcription_history)
-        HISTORY_FILE.write_text(json.dumps(history_list, indent=2))
+        with history_lock:
+            transcription_history.append(entry)
+            history_pending.append(entry)
+            
+            if history_flush_timer is None:
+                history_flush_timer = threading.Timer(HISTORY_FLUSH_DELAY, flush_history)
+                history_flush_timer.daemon = True
+                history_flush_timer.start()
         
-        log_debug(f"Saved to history: {len(transcription_history)} entries")
+        log_debug("Saved to history: %d entries", len(transcription_history))
     except Exception as e:
         log_error(f"Failed to save history: {e}", e)
 
@@ -1126,9 +1621,8 @@ def on_move(x, y):
     
     if not is_recording:
         return
-    log_debug(f"on_move: Current shake_threshold={shake_threshold}")
     
-    current_time = time.time() * 1000 # Convert to milliseconds
+    current_time = time.monotonic() * 1000 # Convert to milliseconds
     
     shake_threshold = config_manager.get('mouse_shake_threshold_px')
     shake_time_ms = config_manager.get('mouse_shake_time_ms')
@@ -1160,25 +1654,65 @@ def on_move(x, y):
     
     # 4. Check for shake threshold
     if distance > shake_threshold:
-        log_info(f"Mouse shake detected: {distance:.1f}px moved in {shake_time_ms}ms - stopping recording")
-        stop_recording()
+        log_info("Mouse shake detected: %.1fpx moved in %sms - stopping recording", distance, shake_time_ms)
+        mouse_move_history.clear()
+        queue_input_action(stop_recording)
         
 def load_history():
     """Load transcription history from file"""
+    global history_file_lines
     try:
         if HISTORY_FILE.exists():
-            data = json.loads(HISTORY_FILE.read_text())
-            transcription_history.extend(data)
+            for line in HISTORY_FILE.read_text(encoding='utf-8').splitlines():
+                if not line.strip():
+                    continue
+                history_file_lines += 1
+                try:
+                    transcription_history.append(load_history_entry(line))
+                except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+                    log_debug("Skipping corrupt history line")
             log_info(f"Loaded {len(transcription_history)} history entries")
+        elif LEGACY_HISTORY_FILE.exists():
+            # Migrate the old single-array JSON history
+            data = json.loads(LEGACY_HISTORY_FILE.read_text())
+            transcription_history.extend(data)
+            write_history_file()
+            log_info(f"Migrated {len(transcription_history)} history entries to {HISTORY_FILE}")
     except Exception as e:
         log_error(f"Failed to load history: {e}", e)
 
+def queue_input_action(func, *args):
+    """Run func(*args) on the input worker so the pynput hook thread returns immediately"""
+    input_action_queue.put_nowait((func, args))
+
+def input_action_loop():
+    """Background thread: run queued mouse actions in order, off the listener thread"""
+    while True:
+        # Block for the first action, then drain everything queued behind it
+        batch = [input_action_queue.get()]
+        while True:
+            try:
+                batch.append(input_action_queue.get_nowait())
+            except Empty:
+                break
+        
+        for i, (func, args) in enumerate(batch):
+            # Back-to-back shake stops are idempotent - run once (clicks always run, each is real input)
+            if i and func is stop_recording and batch[i - 1][0] is stop_recording:
+                continue
+            try:
+                func(*args)
+            except Exception as e:
+                log_error(f"Input action error: {e}", e)
+
 def on_click(x, y, button, pressed):
+    """Mouse click hook - only queues the press; handle_click does the work"""
+    if pressed:
+        queue_input_action(handle_click, x, y, button)
+
+def handle_click(x, y, button):
     """Mouse click handler - Any click stops recording, Right-click cancels, Middle-click toggles start/stop"""
     
-    if not pressed:
-        return
-    
     # Ignore widget clicks
     try:
         if status_widget.root.winfo_viewable():
@@ -1189,7 +1723,7 @@ def on_click(x, y, button, pressed):
             if wx <= x <= wx+ww and wy <= y <= wy+wh:
                 return
     except Exception as e:
-        log_debug(f"Widget check error: {e}")
+        log_debug("Widget check error: %s", e)
     
     # --- Stop/Cancel Logic (Priority when recording) ---
     if is_recording:
@@ -1200,11 +1734,11 @@ def on_click(x, y, button, pressed):
         
         # Any other click stops transcription if manual stop is enabled
         if config_manager.get('enable_manual_stop'):
-            log_info(f"Any click detected ({button}) - stopping recording")
+            log_info("Any click detected (%s) - stopping recording", button)
             stop_recording()
             return
         else:
-            log_debug(f"Click ignored ({button}) - manual stop disabled (waiting for auto-stop)")
+            log_debug("Click ignored (%s) - manual stop disabled (waiting for auto-stop)", button)
             return
     
     # --- Start Logic (Only when not recording) ---
@@ -1245,8 +1779,59 @@ def on_click(x, y, button, pressed):
                     log_debug("Left-click did not land in text field")
             else:
                 start_recording()
+
+def whisper_cpu_options(device):
+    """Extra WhisperModel arguments to parallelize CPU inference"""
+    if device != "cpu":
+        return {}
+    # cpu_threads parallelizes each transcribe call across all cores; one worker is
+    # enough since the final tail is only decoded after the streaming worker is joined
+    return {'cpu_threads': os.cpu_count() or 4, 'num_workers': 1}
+
+def load_whisper_model():
+    """Load the Whisper model with auto-fallback to CPU; returns True on success"""
+    global model
+    # Lazy: faster_whisper pulls in ctranslate2 and friends, so import it on the loader thread
+    from faster_whisper import WhisperModel
+    
+    whisper_model = config_manager.get('whisper_model')
+    whisper_device = config_manager.get('whisper_device')
+    whisper_compute_type = config_manager.get('whisper_compute_type')
+    
+    log_info(f"Loading Whisper model ({whisper_model}) on {whisper_device.upper()}...")
+    
+    # Try primary configuration (CUDA)
+    try:
+        model = WhisperModel(
+            whisper_model,
+            device=whisper_device,
+            compute_type=whisper_compute_type,
+            **whisper_cpu_options(whisper_device)
+        )
+        log_info(f"✓ Model ready! ({whisper_model} / {whisper_device} / {whisper_compute_type})")
+        return True
+    except Exception as e:
+        log_error(f"✗ Failed to load model on {whisper_device}: {e}", e)
+        
+        # Auto-fallback to CPU if CUDA was selected
+        if whisper_device == "cuda":
+            log_info("Attempting fallback to CPU...")
+            try:
+                model = WhisperModel(
+                    whisper_model,
+                    device="cpu",
+                    compute_type="int8",
+                    **whisper_cpu_options("cpu")
+                )
+                log_info(f"✓ Model ready on CPU! ({whisper_model} / cpu / int8)")
+                log_info("Note: CPU mode is slower but works. To use GPU, install cuDNN libraries.")
+                return True
+            except Exception as e2:
+                log_error(f"✗ CPU fallback also failed: {e2}", e2)
+    return False
+
 def main():
-    global model, status_widget, settings_widget
+    global status_widget, settings_widget
     
     try:
         log_info("🎤 Voice Click - Advanced Edition")
@@ -1255,8 +1840,14 @@ def main():
         log_info(f"Log file: {LOG_FILE}")
         log_info(f"Loaded config: mouse_shake_threshold_px={config_manager.get('mouse_shake_threshold_px')}")
         
-        # Load history
+        # Load the model in the background while widgets, history and audio are set up
+        model_result = []
+        model_thread = threading.Thread(target=lambda: model_result.append(load_whisper_model()), daemon=True)
+        model_thread.start()
+        
+        # Load history (pending entries are flushed on exit)
         load_history()
+        atexit.register(flush_history)
         
         # Create widgets
         status_widget = RecordingWidget()
@@ -1265,56 +1856,35 @@ def main():
         # Show settings widget on startup for initial configuration
         settings_widget.show()
         
-        # Load model with auto-fallback to CPU
-        whisper_model = config_manager.get('whisper_model')
-        whisper_device = config_manager.get('whisper_device')
-        whisper_compute_type = config_manager.get('whisper_compute_type')
-        
-        log_info(f"Loading Whisper model ({whisper_model}) on {whisper_device.upper()}...")
-        model_loaded = False
-        
-        # Try primary configuration (CUDA)
-        try:
-            model = WhisperModel(
-                whisper_model,
-                device=whisper_device,
-                compute_type=whisper_compute_type
-            )
-            log_info(f"✓ Model ready! ({whisper_model} / {whisper_device} / {whisper_compute_type})")
-            model_loaded = True
-        except Exception as e:
-            log_error(f"✗ Failed to load model on {whisper_device}: {e}", e)
-            
-            # Auto-fallback to CPU if CUDA was selected
-            if whisper_device == "cuda":
-                log_info("Attempting fallback to CPU...")
-                try:
-                    model = WhisperModel(
-                        whisper_model,
-                        device="cpu",
-                        compute_type="int8"
-                    )
-                    log_info(f"✓ Model ready on CPU! ({whisper_model} / cpu / int8)")
-                    log_info("Note: CPU mode is slower but works. To use GPU, install cuDNN libraries.")
-                    model_loaded = True
-                except Exception as e2:
-                    log_error(f"✗ CPU fallback also failed: {e2}", e2)
-        
-        if not model_loaded:
-            log_error("FATAL: Could not load Whisper model on any device")
-            sys.exit(1)
-        
-        # Start audio
-        stream = sd.InputStream(
-            samplerate=SAMPLE_RATE,
+        # Start audio at the device's native rate (mono); resampled once after capture
+        global capture_sample_rate
+        capture_sample_rate = query_capture_sample_rate()
+        stream = sd.RawInputStream(
+            samplerate=capture_sample_rate,
             channels=1,
+            dtype='int16',
+            latency='low',
             callback=audio_callback,
-            blocksize=int(SAMPLE_RATE * 0.03)
+            blocksize=int(capture_sample_rate * 0.03)
         )
         stream.start()
-        log_info("✓ Audio ready")
+        log_info(f"✓ Audio ready ({capture_sample_rate} Hz)")
+        
+        # Most microphones run at 44.1/48 kHz - import scipy now (overlapping the model load), not on the first stop
+        if capture_sample_rate != SAMPLE_RATE:
+            global resample_poly
+            from scipy.signal import resample_poly
+        
+        # Keep the settings widget responsive until the model is ready
+        while model_thread.is_alive():
+            settings_widget.root.update()
+            model_thread.join(0.05)
+        if not model_result or not model_result[0]:
+            log_error("FATAL: Could not load Whisper model on any device")
+            sys.exit(1)
         
-        # Start mouse listener
+        # Start mouse listener (clicks are handled on the input worker thread)
+        threading.Thread(target=input_action_loop, daemon=True).start()
         listener = mouse.Listener(on_click=on_click, on_move=on_move)
         listener.start()
         log_info("✓ Mouse ready")
@@ -1323,6 +1893,7 @@ def main():
         global focus_monitor_thread, focus_monitor_stop
         if config_manager.get('auto_start_on_focus'):
             focus_monitor_stop = False
+            focus_monitor_wakeup.clear()
             focus_monitor_thread = threading.Thread(target=focus_monitor, daemon=True)
             focus_monitor_thread.start()
             log_info("✓ Focus monitor active")
@@ -1333,7 +1904,7 @@ def main():
         
         log_info("")
         log_info("ADVANCED FEATURES:")
-        log_info(f"  • Whisper Model: {whisper_model} on {whisper_device.upper()} ({whisper_compute_type})")
+        log_info(f"  • Whisper Model: {config_manager.get('whisper_model')} on {config_manager.get('whisper_device').upper()} ({config_manager.get('whisper_compute_type')})")
         log_info(f"  • Volume monitoring with real-time feedback")
         
         # Auto-stop info
@@ -1409,9 +1980,7 @@ def main():
             stream.close()
             listener.stop()
             # Stop focus monitor
-            focus_monitor_stop = True
-            if focus_monitor_thread and focus_monitor_thread.is_alive():
-                focus_monitor_thread.join(timeout=0.5)
+            stop_focus_monitor()
     
     except Exception as e:
         log_error(f"Fatal error in main: {e}", e)